@@ -2,11 +2,16 @@
 Admin commands for managing players and characters.
 """
 
+import re
 from evennia import Command
 from evennia.utils import search
 from evennia.objects.models import ObjectDB
 from evennia.accounts.models import AccountDB
 
+# Changelog colour markup: version numbers start blue, list items reset it
+_CHANGELOG_MARKUP = {'v': '|cv', '\n-': '|n\n-'}
+_CHANGELOG_MARKUP_RE = re.compile('|'.join(map(re.escape, _CHANGELOG_MARKUP)))
+
 class CmdRespawn(Command):
     """
     Respawn a player at the world spawn point.
@@ -80,7 +85,7 @@ class CmdCleanupAccounts(Command):
         """Execute command."""
         count = 0
         for account in AccountDB.objects.all():
-            if hasattr(account.db, '_playable_characters'):
+            if account.db._playable_characters is not None:
                 valid_characters = []
                 for char in account.db._playable_characters:
                     if char and hasattr(char, 'is_typeclass') and char.is_typeclass('typeclasses.characters.Character'):
@@ -144,24 +149,29 @@ class CmdDebugCharacter(Command):
             return
             
         char = char[0]
-        self.msg(f"Debug info for character: {char.key}")
-        self.msg(f"Object ID: {char.id}")
-        self.msg(f"Typeclass: {char.typeclass_path}")
-        self.msg(f"Location: {char.location}")
-        self.msg(f"Home: {char.home}")
-        self.msg(f"Permissions: {char.permissions.all()}")
-        self.msg(f"Locks: {char.locks}")
+        # Collect the report and send it as one message
+        lines = [
+            f"Debug info for character: {char.key}",
+            f"Object ID: {char.id}",
+            f"Typeclass: {char.typeclass_path}",
+            f"Location: {char.location}",
+            f"Home: {char.home}",
+            f"Permissions: {char.permissions.all()}",
+            f"Locks: {char.locks}",
+        ]
         
-        if hasattr(char.db, 'account'):
-            self.msg(f"Linked account: {char.db.account}")
+        linked_account = char.db.account
+        if linked_account:
+            lines.append(f"Linked account: {linked_account}")
         else:
-            self.msg("No account link found in char.db.account")
+            lines.append("No account link found in char.db.account")
             
         # Check which accounts have this character in their playable_characters
         for account in AccountDB.objects.all():
-            if hasattr(account.db, '_playable_characters'):
-                if char in account.db._playable_characters:
-                    self.msg(f"Found in account's playable_characters: {account}") 
+            if char in (account.db._playable_characters or ()):
+                lines.append(f"Found in account's playable_characters: {account}")
+        
+        self.msg("\n".join(lines))
 
 class CmdLastWipe(Command):
     """
@@ -247,8 +257,9 @@ class CmdChangelog(Command):
                 self.caller.msg("-" * 50)
                 
                 # Show full changelog with colored version numbers
-                colored_log = changelog.replace('v', '|cv')
-                colored_log = colored_log.replace('\n-', '|n\n-')
+                colored_log = _CHANGELOG_MARKUP_RE.sub(
+                    lambda match: _CHANGELOG_MARKUP[match.group(0)], changelog
+                )
                 self.caller.msg(colored_log)
                 
                 self.caller.msg("-" * 50)
@@ -304,7 +315,7 @@ class CmdResetWorld(Command):
             # Move all players to Limbo
             caller.msg("Moving players to Limbo...")
             for account in AccountDB.objects.all():
-                if hasattr(account.db, '_playable_characters'):
+                if account.db._playable_characters:
                     for char in account.db._playable_characters:
                         if char and char.location:
                             char.location = limbo
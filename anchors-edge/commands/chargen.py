@@ -7,12 +7,14 @@ from evennia.utils import create
 from evennia.utils import search
 from django.conf import settings
 from evennia.utils.search import search_object
-from textwrap import TextWrapper
 import json
 import random
 from pathlib import Path
 from typeclasses.characters import Character
-from utils.text import format_description
+from utils.text import format_description, get_wrapper
+
+# Height input separators (feet/inches marks, decimal points) become spaces
+_HEIGHT_SEPARATORS = str.maketrans("'.", "  ")
 
 def _check_name(caller, name):
     """Check if name is valid and unique."""
@@ -30,10 +32,7 @@ def _check_name(caller, name):
 
 def wrap_text(text, width=78):
     """Helper function to wrap text consistently."""
-    wrapper = TextWrapper(width=width, expand_tabs=True, 
-                         replace_whitespace=False,
-                         break_long_words=False,
-                         break_on_hyphens=False)
+    wrapper = get_wrapper(width, break_words=False)
     
     # Split into lines, wrap each line separately to preserve formatting
     lines = text.split('\n')
@@ -604,6 +603,27 @@ Enter |wm|n or |wf|n:"""
     options = {"key": "_default", "goto": _set_gender}
     return wrap_text(text), options
 
+def _get_height_range(race, subrace, gender):
+    """
+    Get the min/max height for a race, falling back to normal humans.
+    
+    Args:
+        race (str): The character's race
+        subrace (str): The character's subrace, if any
+        gender (str): Lowercase gender key
+        
+    Returns:
+        dict: The "min" and "max" height in inches
+    """
+    height_ranges = settings.RACE_HEIGHT_RANGES
+    race_ranges = height_ranges.get(race)
+    if race_ranges:
+        if subrace and subrace in race_ranges:
+            return race_ranges[subrace][gender]
+        if gender in race_ranges:
+            return race_ranges[gender]
+    return height_ranges["Human"]["normal"][gender]
+
 def node_height_select(caller):
     """Select character height."""
     race = caller.ndb._menutree.race
@@ -618,15 +638,7 @@ Choose your character's height. Different races have different natural height ra
 |wHeight Range for {race}{f" ({subrace})" if subrace else ""}:|n"""
 
     # Get height ranges for race/subrace/gender
-    if subrace and race in settings.RACE_HEIGHT_RANGES and subrace in settings.RACE_HEIGHT_RANGES[race]:
-        height_range = settings.RACE_HEIGHT_RANGES[race][subrace][gender]
-    elif race in settings.RACE_HEIGHT_RANGES:
-        if isinstance(settings.RACE_HEIGHT_RANGES[race], dict) and gender in settings.RACE_HEIGHT_RANGES[race]:
-            height_range = settings.RACE_HEIGHT_RANGES[race][gender]
-        else:
-            height_range = settings.RACE_HEIGHT_RANGES["Human"]["normal"][gender]
-    else:
-        height_range = settings.RACE_HEIGHT_RANGES["Human"]["normal"][gender]
+    height_range = _get_height_range(race, subrace, gender)
 
     # Convert min/max to feet and inches for display
     min_feet = height_range["min"] // 12
@@ -648,7 +660,7 @@ Choose your character's height. Different races have different natural height ra
         """Handle height selection."""
         try:
             # Clean up the input string
-            height_str = raw_string.replace("'", " ").replace(".", " ")
+            height_str = raw_string.translate(_HEIGHT_SEPARATORS)
             parts = height_str.split()
             
             if len(parts) >= 2:
@@ -665,15 +677,7 @@ Choose your character's height. Different races have different natural height ra
             gender = caller.ndb._menutree.gender.lower()
             
             # Get valid height range
-            if subrace and race in settings.RACE_HEIGHT_RANGES and subrace in settings.RACE_HEIGHT_RANGES[race]:
-                valid_range = settings.RACE_HEIGHT_RANGES[race][subrace][gender]
-            elif race in settings.RACE_HEIGHT_RANGES:
-                if isinstance(settings.RACE_HEIGHT_RANGES[race], dict) and gender in settings.RACE_HEIGHT_RANGES[race]:
-                    valid_range = settings.RACE_HEIGHT_RANGES[race][gender]
-                else:
-                    valid_range = settings.RACE_HEIGHT_RANGES["Human"]["normal"][gender]
-            else:
-                valid_range = settings.RACE_HEIGHT_RANGES["Human"]["normal"][gender]
+            valid_range = _get_height_range(race, subrace, gender)
             
             # Check if height is within valid range
             if total_inches < valid_range["min"] or total_inches > valid_range["max"]:
@@ -954,9 +958,6 @@ class DescCommand(Command):
 
 def ensure_default_home():
     """Ensure the default home location exists."""
-    from evennia.utils import create, search
-    from django.conf import settings
-    
     # First try to find Limbo
     limbo = search.search_object("Limbo")
     if limbo:
@@ -975,6 +976,18 @@ def ensure_default_home():
     
     return limbo
 
+def _chargen_options_formatter(optionlist):
+    """
+    Don't display the options - they're already in the node text
+    """
+    return ""
+
+def _chargen_node_formatter(nodetext, optionstext):
+    """
+    Simply return the node text without any formatting
+    """
+    return nodetext
+
 class CmdCreateCharacter(Command):
     """
     Create a new character
@@ -1010,18 +1023,6 @@ class CmdCreateCharacter(Command):
         # Store the default home in the menu tree for later use
         self.caller.ndb._menutree = type('MenuData', (), {'default_home': default_home})
         
-        def custom_formatter(optionlist):
-            """
-            Don't display the options - they're already in the node text
-            """
-            return ""
-            
-        def node_formatter(nodetext, optionstext):
-            """
-            Simply return the node text without any formatting
-            """
-            return nodetext
-            
         # Start the menu with custom formatting
         EvMenu(self.caller,
                {
@@ -1043,8 +1044,8 @@ class CmdCreateCharacter(Command):
                },
                startnode=start_node,
                cmd_on_exit=None,
-               options_formatter=custom_formatter,
-               node_formatter=node_formatter,
+               options_formatter=_chargen_options_formatter,
+               node_formatter=_chargen_node_formatter,
                options_separator="")
   
 def node_age_verification(caller):
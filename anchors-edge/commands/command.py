@@ -13,9 +13,21 @@ from evennia.commands.default.general import CmdLook
 from evennia import default_cmds
 import random
 import os
-import requests
+from bisect import bisect_left
+from collections import OrderedDict
+from utils.http import SESSION, LLM_TIMEOUT, parse_json
 from time import time
 
+# Recent drunk-speech rewrites, keyed by (message, intoxication level), so
+# repeated lines don't cost another OpenRouter round trip
+_DRUNK_SPEECH_CACHE = OrderedDict()
+_DRUNK_SPEECH_CACHE_SIZE = 128
+
+# Health bar colours: empty, very low, half, good, full/nearly full.
+# A health value up to and including each threshold takes that colour.
+_HEALTH_THRESHOLDS = (0, 2, 5, 8)
+_HEALTH_COLORS = ("|r", "|505", "|y", "|g", "|G")
+
 class CmdDescribeSelf(MuxCommand):
     """
     Describe yourself while looking in the mirror
@@ -68,10 +80,6 @@ class BriefCommand(MuxCommand):
         """Toggle brief mode"""
         caller = self.caller
         
-        # Initialize brief_mode if it doesn't exist
-        if not hasattr(caller.db, "brief_mode"):
-            caller.db.brief_mode = False
-            
         # Toggle brief mode
         if caller.db.brief_mode:
             caller.db.brief_mode = False
@@ -163,6 +171,12 @@ class SayCommand(default_cmds.MuxCommand):
         if intoxication_level <= 1:  # Skip if sober or just tipsy
             return message
 
+        cache_key = (message, intoxication_level)
+        cached = _DRUNK_SPEECH_CACHE.get(cache_key)
+        if cached is not None:
+            _DRUNK_SPEECH_CACHE.move_to_end(cache_key)
+            return cached
+
         url = "https://openrouter.ai/api/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {OPENROUTER_API_KEY}",
@@ -215,14 +229,18 @@ class SayCommand(default_cmds.MuxCommand):
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = SESSION.post(url, headers=headers, json=data, timeout=LLM_TIMEOUT)
             if response.status_code == 200:
-                drunk_message = response.json()['choices'][0]['message']['content'].strip()
+                drunk_message = parse_json(response)['choices'][0]['message']['content'].strip()
                 # Clean up any quotes or extra spaces
                 drunk_message = drunk_message.strip("'\"").strip()
                 # Add occasional hiccups based on intoxication
                 if intoxication_level >= 3 and len(message) > 10:
                     drunk_message = drunk_message.replace(". ", ". *hic* ")
+                # Only successful rewrites are cached, so failures get retried
+                _DRUNK_SPEECH_CACHE[cache_key] = drunk_message
+                if len(_DRUNK_SPEECH_CACHE) > _DRUNK_SPEECH_CACHE_SIZE:
+                    _DRUNK_SPEECH_CACHE.popitem(last=False)
                 return drunk_message
         except Exception as e:
             print(f"Error modifying drunk speech: {e}")
@@ -278,7 +296,7 @@ class SayCommand(default_cmds.MuxCommand):
             caller.msg(f'You {action_text_self} to {target.name}, "{message}"')
             
             # If target is an NPC, handle conversation
-            if hasattr(target, 'db') and hasattr(target.db, 'is_npc') and target.db.is_npc:
+            if hasattr(target, 'db') and target.db.is_npc:
                 response = target.handle_conversation(caller, message)
                 # Send response to everyone in the room
                 caller.location.msg_contents(response.strip())
@@ -314,16 +332,7 @@ class CmdInventory(default_cmds.CmdInventory):
     
     def get_health_color(self, health):
         """Get color code based on health percentage"""
-        if health <= 0:
-            return "|r"  # Red for empty
-        elif health <= 2:
-            return "|505"  # Dark red for very low
-        elif health <= 5:
-            return "|y"  # Yellow for half
-        elif health <= 8:
-            return "|g"  # Green for good
-        else:
-            return "|G"  # Bright green for full/nearly full
+        return _HEALTH_COLORS[bisect_left(_HEALTH_THRESHOLDS, health)]
     
     def func(self):
         """Handle the inventory display"""
@@ -336,7 +345,7 @@ class CmdInventory(default_cmds.CmdInventory):
                 # Get health if it's a consumable item
                 health = None
                 if hasattr(item, 'db'):
-                    health = item.db.health if hasattr(item.db, 'health') else None
+                    health = item.db.health
                 
                 if health is not None:
                     # Add health bar for consumable items
@@ -621,19 +630,19 @@ class CmdChug(default_cmds.MuxCommand):
             self.caller.msg(f"You can't chug {drink.name} - it's not a drink!")
             return
 
-        if not hasattr(drink.db, 'health') or drink.db.health <= 0:
+        health = drink.db.health
+        if health is None or health <= 0:
             self.caller.msg(f"The {drink.name} is empty!")
             return
 
         # Consume all remaining charges at once
-        health = drink.db.health
-        alcohol_content = drink.db.alcohol_content if hasattr(drink.db, 'alcohol_content') else 0
+        alcohol_content = drink.db.alcohol_content or 0
         
         # Apply effects (multiply by charges for "chugging" effect)
         if alcohol_content:
             # Drinking quickly hits harder - multiply effect by 1.5
             total_alcohol = (alcohol_content * health) * 1.5
-            self.caller.db.intoxication = (self.caller.db.intoxication or 0) + total_alcohol
+            self.caller.add_intoxication(total_alcohol)
 
         # Empty the container
         drink.db.health = 0
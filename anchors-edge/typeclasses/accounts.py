@@ -26,6 +26,16 @@ from evennia.accounts.accounts import DefaultAccount, DefaultGuest
 from evennia import search_object
 from django.conf import settings
 
+# OOC character selection screen text
+_NO_CHARACTERS_TEXT = (
+    "\n|wWelcome! You have no characters yet.|n"
+    "\nUse the |wcharcreate|n command to create a new character."
+)
+_CHARACTERS_HEADER = "\n|wYour available characters:|n"
+_CHARACTER_LINE = "\n- |c{}|n [{}]{}"
+_CHARACTERS_FOOTER = (
+    "\n\nUse |wcharselect <name>|n to play as a character or |wcharcreate|n to make a new one."
+)
 
 class Account(DefaultAccount):
     """
@@ -175,7 +185,7 @@ class Account(DefaultAccount):
             for char in characters:
                 if char:  # Make sure character exists
                     status = "  (Online)" if char.has_account else ""
-                    self.msg(f" - |c{char.key}|n [{char.db.race}{f' - {char.db.subrace}' if hasattr(char.db, 'subrace') and char.db.subrace else ''}]{status}")
+                    self.msg(f" - |c{char.key}|n [{char.db.race}{f' - {char.db.subrace}' if char.db.subrace else ''}]{status}")
             
             self.msg("\nUse |wcharselect <name>|n to play as a character or |wcharcreate|n to make a new one.")
             
@@ -205,7 +215,7 @@ class Account(DefaultAccount):
         """
         super().at_init()
         # Ensure _playable_characters exists and is a list
-        if not hasattr(self.db, '_playable_characters') or self.db._playable_characters is None:
+        if self.db._playable_characters is None:
             self.db._playable_characters = []
         elif not isinstance(self.db._playable_characters, list):
             self.db._playable_characters = list(self.db._playable_characters)
@@ -224,19 +234,20 @@ class Account(DefaultAccount):
         # If we have no characters, just show the welcome message once
         characters = self.db._playable_characters
         if not characters:
-            string = "\n|wWelcome! You have no characters yet.|n"
-            string += "\nUse the |wcharcreate|n command to create a new character."
-            return string
+            return _NO_CHARACTERS_TEXT
         
         # Otherwise show the character selection screen
-        string = "\n|wYour available characters:|n"
+        lines = [_CHARACTERS_HEADER]
         for char in characters:
             if char:  # Make sure character exists
                 status = "  (Online)" if char.has_account else ""
-                string += f"\n- |c{char.key}|n [{char.db.race}{f' - {char.db.subrace}' if hasattr(char.db, 'subrace') and char.db.subrace else ''}]{status}"
-        string += "\n\nUse |wcharselect <name>|n to play as a character or |wcharcreate|n to make a new one."
+                race = char.db.race
+                subrace = char.db.subrace
+                race_text = f"{race} - {subrace}" if subrace else race
+                lines.append(_CHARACTER_LINE.format(char.key, race_text, status))
+        lines.append(_CHARACTERS_FOOTER)
         
-        return string
+        return "".join(lines)
 
     def return_appearance(self, looker, **kwargs):
         """
@@ -13,7 +13,7 @@ from .objects import ObjectParent
 import random
 from datetime import datetime
 import os
-import requests
+from utils.http import SESSION, LLM_TIMEOUT, parse_json
 from time import time
 from dotenv import load_dotenv
 import re
@@ -35,6 +35,40 @@ INTOX_DRUNK = 30  # 16-30
 INTOX_VERY_DRUNK = 45  # 31-45
 INTOX_PASS_OUT = 50  # 46-50
 
+# Atmospheric lines for a character's description, by time period
+_TIME_ATMOSPHERES = {
+    "dawn": [
+        "The soft light of dawn highlights their features.",
+        "Early morning light casts gentle shadows across their form.",
+        "Dawn's first rays give them an ethereal glow."
+    ],
+    "morning": [
+        "Morning light brings out the warmth in their features.",
+        "The bright morning sun illuminates their presence.",
+        "Clear morning light shows them in sharp detail."
+    ],
+    "noon": [
+        "The midday sun casts sharp shadows around them.",
+        "Bright daylight reveals every detail of their appearance.",
+        "They stand clearly visible in the full light of day."
+    ],
+    "afternoon": [
+        "The afternoon sun bathes them in golden light.",
+        "Warm afternoon light softens their features.",
+        "They are outlined by the slanting afternoon sun."
+    ],
+    "dusk": [
+        "The fading light of dusk softens their silhouette.",
+        "Twilight shadows play across their features.",
+        "The last rays of sun give them a mysterious air."
+    ],
+    "night": [
+        "Shadows of night cloak their form in mystery.",
+        "Darkness shrouds their features in intrigue.",
+        "The night's darkness leaves only their silhouette visible."
+    ]
+}
+
 def get_intoxication_description(intoxication):
     """Helper function to get description based on intoxication level"""
     if not intoxication or intoxication <= INTOX_SOBER:
@@ -48,6 +82,19 @@ def get_intoxication_description(intoxication):
     else:
         return "|/|RThey are completely intoxicated and can barely stand.|n"
 
+def _intoxication_level(intoxication):
+    """Map a raw intoxication value to a 0-4 intoxication state"""
+    if intoxication <= INTOX_SOBER:
+        return 0  # Sober
+    elif intoxication <= INTOX_TIPSY:
+        return 1  # Tipsy
+    elif intoxication <= INTOX_DRUNK:
+        return 2  # Drunk
+    elif intoxication <= INTOX_VERY_DRUNK:
+        return 3  # Very drunk
+    else:
+        return 4  # About to pass out
+
 class Character(ObjectParent, DefaultCharacter):
     """Base character class"""
     def at_object_creation(self):
@@ -65,9 +112,7 @@ class Character(ObjectParent, DefaultCharacter):
         self.db.intoxication = 0    # Current intoxication level
         self.db.max_intoxication = INTOX_PASS_OUT  # Pass out at this level
         
-        # Start the sobriety ticker (checks every minute)
-        from evennia import TICKER_HANDLER
-        TICKER_HANDLER.add(60, self.process_sobriety)
+        # The sobriety ticker is only started once the character drinks
         
         # Add rate limiting attributes
         self.db.last_consume_message = 0  # Timestamp of last consume message
@@ -99,9 +144,10 @@ class Character(ObjectParent, DefaultCharacter):
             
     def get_currency(self):
         """Get the character's current currency amounts"""
-        if not hasattr(self.db, "currency"):
-            self.db.currency = {"gold": 0, "silver": 0, "copper": 0}
-        return self.db.currency
+        currency = self.db.currency
+        if currency is None:
+            currency = self.db.currency = {"gold": 0, "silver": 0, "copper": 0}
+        return currency
         
     def add_currency(self, gold=0, silver=0, copper=0):
         """Add currency to the character and normalize"""
@@ -141,54 +187,54 @@ class Character(ObjectParent, DefaultCharacter):
         
     def add_intoxication(self, amount):
         """Add to character's intoxication level"""
-        # Initialize intoxication if it doesn't exist
-        if not hasattr(self.db, "intoxication"):
-            self.db.intoxication = 0
-        if not hasattr(self.db, "max_intoxication"):
-            self.db.max_intoxication = INTOX_PASS_OUT
+        # Missing or unset attributes count as sober / the default limit
+        intoxication = self.attributes.get("intoxication", default=0) or 0
+        max_intoxication = self.attributes.get("max_intoxication", default=INTOX_PASS_OUT) or INTOX_PASS_OUT
             
-        old_level = self.get_intoxication_level()
-        self.db.intoxication = max(0, min(self.db.max_intoxication, self.db.intoxication + amount))
-        new_level = self.get_intoxication_level()
+        old_level = _intoxication_level(intoxication)
+        intoxication = max(0, min(max_intoxication, intoxication + amount))
+        self.db.intoxication = intoxication
+        new_level = _intoxication_level(intoxication)
+        
+        # Start sobering up (checks every minute); the ticker stops itself
+        # once the character is sober again. Adding an existing ticker just
+        # replaces it, so this also recovers a drunk character without one
+        if intoxication > 0:
+            from evennia import TICKER_HANDLER
+            TICKER_HANDLER.add(60, self.process_sobriety)
         
         # Notify of state changes
         if old_level != new_level:
             self.msg(self.get_intoxication_message())
             
         # Pass out if too drunk
-        if self.db.intoxication >= self.db.max_intoxication:
+        if intoxication >= max_intoxication:
             self.msg("You pass out from too much drink!")
             self.location.msg_contents(f"{self.name} passes out drunk!", exclude=[self])
             # TODO: Add any pass out effects here
             
     def process_sobriety(self, *args, **kwargs):
         """Process recovery from intoxication"""
-        if self.db.intoxication > 0:
-            old_level = self.get_intoxication_level()
-            self.db.intoxication = max(0, self.db.intoxication - 1)
-            new_level = self.get_intoxication_level()
+        intoxication = self.attributes.get("intoxication", default=0) or 0
+        if intoxication > 0:
+            old_level = _intoxication_level(intoxication)
+            intoxication = max(0, intoxication - 1)
+            self.db.intoxication = intoxication
+            new_level = _intoxication_level(intoxication)
             
             # Notify if state has changed
             if old_level != new_level:
                 self.msg(self.get_intoxication_message())
+        
+        # Sober characters don't need a ticker
+        if intoxication <= 0:
+            from evennia import TICKER_HANDLER
+            TICKER_HANDLER.remove(60, self.process_sobriety)
                 
     def get_intoxication_level(self):
         """Get the current intoxication state"""
-        # Initialize if needed
-        if not hasattr(self.db, "intoxication") or self.db.intoxication is None:
-            self.db.intoxication = 0
-            
-        intox = self.db.intoxication
-        if intox <= INTOX_SOBER:
-            return 0  # Sober
-        elif intox <= INTOX_TIPSY:
-            return 1  # Tipsy
-        elif intox <= INTOX_DRUNK:
-            return 2  # Drunk
-        elif intox <= INTOX_VERY_DRUNK:
-            return 3  # Very drunk
-        else:
-            return 4  # About to pass out
+        # Missing or unset intoxication counts as sober
+        return _intoxication_level(self.attributes.get("intoxication", default=0) or 0)
             
     def get_intoxication_message(self):
         """Get a message describing current intoxication state"""
@@ -219,10 +265,11 @@ class Character(ObjectParent, DefaultCharacter):
         ]
         
         # Add race-specific parts
-        if hasattr(self.db, 'race'):
-            if self.db.race in ["Kobold", "Ashenkin"]:
+        race = self.db.race
+        if race:
+            if race in ["Kobold", "Ashenkin"]:
                 part_order.extend(["horns", "tail"])
-            elif self.db.race == "Feline":
+            elif race == "Feline":
                 part_order.append("tail")
         
         # Build the description string
@@ -255,18 +302,14 @@ class Character(ObjectParent, DefaultCharacter):
         current_time = time()
         
         # Initialize attributes if they don't exist
-        if not hasattr(self.db, 'last_consume_message'):
-            self.db.last_consume_message = 0
-        if not hasattr(self.db, 'consume_cooldown'):
-            self.db.consume_cooldown = 5
-
-        # Ensure we have valid values
-        if self.db.last_consume_message is None:
-            self.db.last_consume_message = 0
-        if self.db.consume_cooldown is None:
-            self.db.consume_cooldown = 5
-        
-        if current_time - self.db.last_consume_message >= self.db.consume_cooldown:
+        last_message = self.db.last_consume_message
+        if last_message is None:
+            last_message = self.db.last_consume_message = 0
+        cooldown = self.db.consume_cooldown
+        if cooldown is None:
+            cooldown = self.db.consume_cooldown = 5
+        
+        if current_time - last_message >= cooldown:
             self.db.last_consume_message = current_time
             return True
         return False
@@ -538,15 +581,14 @@ class NPC(Character):
         recent_interactions = player_memory.get("recent_interactions", [])[-3:]  # Last 3 interactions
 
         # Build conversation context
-        context = (
-            f"Recent conversation between {source.name} and {self.name}:|/|/"
-        )
+        lines = [f"Recent conversation between {source.name} and {self.name}:|/|/"]
         
         for interaction in recent_interactions:
-            context += f"{source.name}: {interaction['message']}|/"
-            context += f"{self.name}: {interaction['response']}|/"
+            lines.append(f"{source.name}: {interaction['message']}|/")
+            lines.append(f"{self.name}: {interaction['response']}|/")
 
-        context += f"|/{source.name} just gave {amount} {currency_type} to {self.name}.|/"
+        lines.append(f"|/{source.name} just gave {amount} {currency_type} to {self.name}.|/")
+        context = "".join(lines)
 
         # Prepare the prompt
         prompt = (
@@ -584,14 +626,13 @@ class NPC(Character):
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = SESSION.post(url, headers=headers, json=data, timeout=LLM_TIMEOUT)
             if response.status_code == 200:
                 # Check each response in order until we find valid item tags
-                for choice in response.json()['choices']:
+                for choice in parse_json(response)['choices']:
                     content = choice['message']['content'].strip()
                     
                     # Parse the response for item tags
-                    import re
                     drink_matches = re.findall(r"<drink name='([^']+)' cp='(\d+)' intoxication='(\d+)'/>", content)
                     food_matches = re.findall(r"<food name='([^']+)' cp='(\d+)'/>", content)
                     
@@ -706,7 +747,6 @@ class NPC(Character):
         # Check if this is a currency transaction
         if hasattr(moved_obj, 'key') and any(currency in moved_obj.key.lower() for currency in ['gold', 'silver', 'copper']):
             # Extract amount and type from the coin object's key
-            import re
             match = re.match(r'(\d+)\s*(gold|silver|copper)', moved_obj.key.lower())
             if match:
                 amount = int(match.group(1))
@@ -765,57 +805,59 @@ class OpenrouterCharacter(NPC):
             
         # Get room context
         room = self.location
-        room_desc = room.db.desc if room and hasattr(room, 'db') else "unknown location"
+        # Rooms with dynamic descriptions (like the tavern) keep the current
+        # text out of db.desc, so ask the room for what a looker would see
+        room_desc = room.get_display_desc(self) if room else "unknown location"
         time_period = room.get_time_period() if hasattr(room, 'get_time_period') else "unknown time"
         
         # Get list of characters and their descriptions in the room
         character_info = []
         if room:
             for char in room.contents:
-                if hasattr(char, 'has_account') or (hasattr(char.db, 'is_npc') and char.db.is_npc):
+                if hasattr(char, 'has_account') or char.db.is_npc:
                     if char != self:  # Don't include self in the list
-                        desc = char.db.desc if hasattr(char.db, 'desc') and char.db.desc else "no description"
+                        desc = char.db.desc or "no description"
                         character_info.append(f"{char.key}: {desc}")
         
-        # Build conversation context
-        context = (
+        # Build conversation context as a list of pieces, joined once
+        lines = [
             f"You are roleplaying as {self.key}, {self.db.personality}|/"
             f"Conversation style: {self.db.conversation_style}|/"
             f"Knowledge: {self.db.knowledge}|/|/"
             f"Time of day: {time_period}|/"
             f"The room's current state: {room_desc}|/|/"
             "People currently in the room:|/"
-        )
+        ]
         
         # Add character descriptions
         if character_info:
             for info in character_info:
-                context += f"- {info}|/"
+                lines.append(f"- {info}|/")
         else:
-            context += "- No one else is here|/"
+            lines.append("- No one else is here|/")
         
-        context += "|/Example responses for specific topics:|/"
+        lines.append("|/Example responses for specific topics:|/")
         
         # Add example responses
         for triggers, responses in self.db.responses.items():
             trigger_words = [t.strip() for t in triggers.split(',')]
-            example_responses = list(responses)  # Convert _SaverList to list
-            context += f"When someone mentions {' or '.join(trigger_words)}, you might say:|/"
-            for response in example_responses:
-                context += f"- {response}|/"
-            context += "|/"
+            lines.append(f"When someone mentions {' or '.join(trigger_words)}, you might say:|/")
+            for response in responses:
+                lines.append(f"- {response}|/")
+            lines.append("|/")
             
-        context += f"|/In a conversation with {speaker.key}:|/"
+        lines.append(f"|/In a conversation with {speaker.key}:|/")
         
         # Add recent conversation history
         for interaction in conversation_history[-3:]:
-            context += (
+            lines.append(
                 f"{speaker.key}: {interaction['message']}|/"
                 f"{self.key}: {interaction['response']}|/"
             )
             
         # Add current message
-        context += f"|/{speaker.key}: {message}|/{self.key}:"
+        lines.append(f"|/{speaker.key}: {message}|/{self.key}:")
+        context = "".join(lines)
         
         # Prepare API request
         url = "https://openrouter.ai/api/v1/chat/completions"
@@ -847,9 +889,9 @@ class OpenrouterCharacter(NPC):
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = SESSION.post(url, headers=headers, json=data, timeout=LLM_TIMEOUT)
             if response.status_code == 200:
-                ai_response = response.json()['choices'][0]['message']['content'].strip()
+                ai_response = parse_json(response)['choices'][0]['message']['content'].strip()
                 return ai_response
         except Exception as e:
             print(f"OpenRouter API error: {e}")
@@ -863,7 +905,6 @@ class OpenrouterCharacter(NPC):
         full_response = self.get_ai_response(speaker, message, player_memory["recent_interactions"])
         
         # Extract the visible message from the response
-        import re
         visible_message = ""
         message_match = re.search(r"<message>(.*?)</message>", full_response, re.DOTALL)
         if message_match:
@@ -887,62 +928,28 @@ class OpenrouterCharacter(NPC):
         Called when room weather changes.
         """
         # Get base description
-        if not hasattr(self.db, 'base_desc'):
-            self.db.base_desc = self.db.desc or "You see nothing special."
+        base_desc = self.db.base_desc
+        if base_desc is None:
+            base_desc = self.db.base_desc = self.db.desc or "You see nothing special."
         
         # Get room context
         room = self.location
         if not room:
-            self.db.desc = self.db.base_desc
+            self.db.desc = base_desc
             return
         
-        # Get time and weather data
+        # Get time data
         time_period = room.get_time_period() if hasattr(room, 'get_time_period') else None
-        weather_data = room.db.weather_data if hasattr(room.db, 'weather_data') else {}
-        
-        # Atmospheric descriptions based on conditions
-        time_descriptions = {
-            "dawn": [
-                "The soft light of dawn highlights their features.",
-                "Early morning light casts gentle shadows across their form.",
-                "Dawn's first rays give them an ethereal glow."
-            ],
-            "morning": [
-                "Morning light brings out the warmth in their features.",
-                "The bright morning sun illuminates their presence.",
-                "Clear morning light shows them in sharp detail."
-            ],
-            "noon": [
-                "The midday sun casts sharp shadows around them.",
-                "Bright daylight reveals every detail of their appearance.",
-                "They stand clearly visible in the full light of day."
-            ],
-            "afternoon": [
-                "The afternoon sun bathes them in golden light.",
-                "Warm afternoon light softens their features.",
-                "They are outlined by the slanting afternoon sun."
-            ],
-            "dusk": [
-                "The fading light of dusk softens their silhouette.",
-                "Twilight shadows play across their features.",
-                "The last rays of sun give them a mysterious air."
-            ],
-            "night": [
-                "Shadows of night cloak their form in mystery.",
-                "Darkness shrouds their features in intrigue.",
-                "The night's darkness leaves only their silhouette visible."
-            ]
-        }
         
         # Select atmospheric descriptions
         atmospheric_desc = []
         
         # Add time-based description
-        if time_period and time_period in time_descriptions:
-            atmospheric_desc.append(random.choice(time_descriptions[time_period]))
+        if time_period and time_period in _TIME_ATMOSPHERES:
+            atmospheric_desc.append(random.choice(_TIME_ATMOSPHERES[time_period]))
         
         # Combine descriptions
-        final_desc = self.db.base_desc
+        final_desc = base_desc
         if atmospheric_desc:
             final_desc += "|/|/" + " ".join(atmospheric_desc)
         
@@ -5,7 +5,7 @@ NPCs for the Salty Maiden tavern.
 import os
 from evennia.contrib.rpg.llm.llm_npc import LLMNPC, LLMClient
 import json
-import requests
+from utils.http import SESSION, LLM_TIMEOUT, parse_json
 
 class OpenRouterClient(LLMClient):
     """Client for communicating with OpenRouter API."""
@@ -43,9 +43,9 @@ class OpenRouterClient(LLMClient):
         }
         
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = SESSION.post(url, headers=self.headers, json=data, timeout=LLM_TIMEOUT)
             response.raise_for_status()
-            result = response.json()
+            result = parse_json(response)
             return result['choices'][0]['message']['content']
         except Exception as e:
             print(f"Error getting response from OpenRouter: {e}")
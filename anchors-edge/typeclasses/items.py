@@ -41,14 +41,15 @@ class Drink(Item):
     def get_drink_desc(self):
         """Get description based on remaining health"""
         base_desc = f"A container of {self.db.drink_type}"
+        health = self.db.health
         
-        if self.db.health <= 0:
+        if health <= 0:
             return f"{base_desc}, completely empty."
-        elif self.db.health <= 2:
+        elif health <= 2:
             return f"{base_desc}, with just a few drops left."
-        elif self.db.health <= 5:
+        elif health <= 5:
             return f"{base_desc}, less than half full."
-        elif self.db.health <= 8:
+        elif health <= 8:
             return f"{base_desc}, more than half full."
         else:
             return f"{base_desc}, nearly full."
@@ -99,15 +100,17 @@ class Food(Item):
         
     def get_food_desc(self):
         """Get description based on remaining health"""
-        base_desc = f"Some {self.db.food_type}"
+        food_type = self.db.food_type
+        health = self.db.health
         
-        if self.db.health <= 0:
-            return f"The remains of {self.db.food_type}, nothing edible left."
-        elif self.db.health <= 2:
+        if health <= 0:
+            return f"The remains of {food_type}, nothing edible left."
+        base_desc = f"Some {food_type}"
+        if health <= 2:
             return f"{base_desc}, just a few crumbs remain."
-        elif self.db.health <= 5:
+        elif health <= 5:
             return f"{base_desc}, about half eaten."
-        elif self.db.health <= 8:
+        elif health <= 8:
             return f"{base_desc}, with a few bites taken."
         else:
             return f"{base_desc}, fresh and untouched."
@@ -1,8 +1,70 @@
 """
 Relationship and knowledge tracking for characters.
+
+The description helpers below run on every look. They are pure string
+formatting and dict lookups, so they stay plain Python (a JIT would not
+help with string work) and read each character attribute once into a
+local.
 """
 
+import re
 from enum import IntEnum
+from functools import lru_cache
+
+# Colour keywords pulled out of free-form eye/hair descriptions
+_EYE_COLOR_RE = re.compile(r'\b(blue|brown|green|gr[ae]y|hazel)\b', re.I)
+_HAIR_COLOR_RE = re.compile(r'\b(black|brown|blonde|red|white|gr[ae]y)\b', re.I)
+
+# Order in which body parts are listed in a full description
+_BASE_PART_ORDER = (
+    'face', 'eyes', 'hair',      # Head area
+    'chest', 'arms', 'hands',    # Upper body
+    'back', 'stomach',           # Mid body
+    'groin', 'bottom',           # Lower body
+    'legs', 'feet'               # Extremities
+)
+
+# Races with extra parts get their own ordering
+_PART_ORDER_BY_RACE = {
+    'Kobold': ('horns',) + _BASE_PART_ORDER + ('tail',),
+    'Ashenkin': ('horns',) + _BASE_PART_ORDER + ('tail',),
+    'Feline': _BASE_PART_ORDER + ('tail',),
+}
+
+@lru_cache(maxsize=4096)
+def _format_brief_description(race, subrace, height_desc):
+    """
+    Format a stranger's brief description. Only a handful of
+    race/subrace/height combinations exist, so the strings are cached.
+    """
+    # Combine race and subrace
+    if subrace:
+        race_desc = f"{subrace} {race}"
+    else:
+        race_desc = race
+        
+    # Format the description
+    if height_desc:
+        return f"A {height_desc} {race_desc.lower()}"
+    else:
+        return f"A {race_desc}"
+
+def _get_attributes(character, defaults):
+    """
+    Fetch several attributes with a single AttributeHandler call.
+    
+    Args:
+        character: The character to read from
+        defaults (dict): Attribute keys mapped to their default values
+        
+    Returns:
+        list: The attribute values, in the order of `defaults`
+    """
+    keys = list(defaults)
+    # return_obj keeps a None placeholder for missing attributes, so the
+    # result lines up with keys
+    attrs = character.attributes.get(keys, return_obj=True, return_list=True)
+    return [attr.value if attr else defaults[key] for key, attr in zip(keys, attrs)]
 
 class KnowledgeLevel(IntEnum):
     """Enum for tracking how well one character knows another."""
@@ -15,13 +77,10 @@ def get_brief_description(character):
     Get a brief description of a character (for strangers).
     Returns height + race description.
     """
-    race = character.db.race
-    subrace = character.db.subrace if character.db.subrace else ""
-    height = character.db.height if hasattr(character.db, 'height') else 0
-    
-    # Convert height to feet/inches
-    feet = height // 12
-    inches = height % 12
+    race, subrace, height = _get_attributes(
+        character, {'race': None, 'subrace': "", 'height': 0}
+    )
+    subrace = subrace or ""
     
     # Height descriptors
     if height:
@@ -34,48 +93,35 @@ def get_brief_description(character):
     else:
         height_desc = ""
     
-    # Combine race and subrace
-    if subrace:
-        race_desc = f"{subrace} {race}"
-    else:
-        race_desc = race
-        
-    # Format the description
-    if height_desc:
-        return f"A {height_desc} {race_desc.lower()}"
-    else:
-        return f"A {race_desc}"
+    return _format_brief_description(race, subrace, height_desc)
         
 def get_basic_description(character):
     """
     Get a basic description of a character (for acquaintances).
     Returns notable physical features.
     """
-    descriptions = character.db.descriptions or {}
+    descriptions, race = _get_attributes(character, {'descriptions': None, 'race': None})
+    descriptions = descriptions or {}
     notable_features = []
     
     # Check for eye description
     if 'eyes' in descriptions:
         # Extract basic eye color from the full description
-        eye_desc = descriptions['eyes'].lower()
-        for color in ['blue', 'brown', 'green', 'gray', 'hazel']:
-            if color in eye_desc:
-                notable_features.append(f"{color} eyes")
-                break
+        match = _EYE_COLOR_RE.search(descriptions['eyes'])
+        if match:
+            notable_features.append(f"{match.group(1).lower()} eyes")
                 
     # Check for hair description
     if 'hair' in descriptions:
         # Extract basic hair description
-        hair_desc = descriptions['hair'].lower()
-        for color in ['black', 'brown', 'blonde', 'red', 'white', 'gray']:
-            if color in hair_desc:
-                notable_features.append(f"{color} hair")
-                break
+        match = _HAIR_COLOR_RE.search(descriptions['hair'])
+        if match:
+            notable_features.append(f"{match.group(1).lower()} hair")
     
     # Combine features
     if notable_features:
         features_text = " and ".join(notable_features)
-        return f"A {character.db.race.lower()} with {features_text} can be seen."
+        return f"A {race.lower()} with {features_text} can be seen."
     else:
         return get_brief_description(character)
         
@@ -84,33 +130,20 @@ def get_full_description(character):
     Get the full description of a character (for friends).
     Returns all description fields in a formatted way.
     """
-    descriptions = character.db.descriptions or {}
+    descriptions, text_description, race = _get_attributes(
+        character, {'descriptions': None, 'text_description': None, 'race': None}
+    )
+    descriptions = descriptions or {}
     
     # Get the overall text description first
     text = ""
-    if hasattr(character.db, 'text_description') and character.db.text_description:
-        text = character.db.text_description + "\n\n"
-    
-    # Define the order for body parts
-    part_order = [
-        'face', 'eyes', 'hair',      # Head area
-        'chest', 'arms', 'hands',    # Upper body
-        'back', 'stomach',           # Mid body
-        'groin', 'bottom',           # Lower body
-        'legs', 'feet'               # Extremities
-    ]
+    if text_description:
+        text = text_description + "\n\n"
     
-    # Add race-specific parts
-    if character.db.race in ["Kobold", "Ashenkin"]:
-        part_order.insert(0, "horns")
-        part_order.append("tail")
-    elif character.db.race == "Feline":
-        part_order.append("tail")
+    # Get the body part order, including race-specific parts
+    part_order = _PART_ORDER_BY_RACE.get(race, _BASE_PART_ORDER)
         
     # Build the detailed description
-    details = []
-    for part in part_order:
-        if part in descriptions:
-            details.append(f"{descriptions[part]}")
-            
-    return text + " ".join(details)
+    return text + " ".join(
+        str(descriptions[part]) for part in part_order if part in descriptions
+    )
@@ -4,70 +4,184 @@ Base room types and templates.
 
 from evennia import DefaultRoom
 from django.conf import settings
+from collections import OrderedDict
 from datetime import datetime
+from time import time
 import pytz
 from evennia.scripts.models import ScriptDB
-from textwrap import fill, TextWrapper
+from utils.text import get_wrapper
+from utils.perms import is_builder
+
+# Game time follows Austin
+_TZ = pytz.timezone('America/Chicago')
+
+# (valid until, UTC offset in seconds) for the game timezone. Offsets only
+# change on the hour (DST), so one lookup holds until the next hour.
+_UTC_OFFSET = (0, 0)
+
+def _current_hour():
+    """
+    Get the current hour (0-23) in the game timezone from the epoch clock,
+    without building a timezone-aware datetime on every call.
+    """
+    global _UTC_OFFSET
+    now = time()
+    valid_until, offset = _UTC_OFFSET
+    if now >= valid_until:
+        offset = datetime.now(_TZ).utcoffset().total_seconds()
+        _UTC_OFFSET = ((now // 3600 + 1) * 3600, offset)
+    return int((now + offset) // 3600 % 24)
+
+# Time period of day for each hour (0-23)
+_HOUR_TO_PERIOD = (
+    ("witching_hour",) * 5      # 0-5
+    + ("dawn",) * 2             # 5-7
+    + ("morning",) * 3          # 7-10
+    + ("noon",) * 4             # 10-14
+    + ("afternoon",) * 3        # 14-17
+    + ("early_evening",) * 2    # 17-19
+    + ("evening",) * 3          # 19-22
+    + ("late_night",) * 2       # 22-24
+)
+
+def current_time_period():
+    """
+    Get the current time period of day in the game timezone. This is the
+    one definition of the periods, shared by rooms and the weather script.
+    
+    Returns:
+        str: Time period name (dawn, morning, ..., witching_hour)
+    """
+    return _HOUR_TO_PERIOD[_current_hour()]
+
+# Recently built descriptions, keyed on the room class, the builder and the
+# weather inputs, so a description is built once per distinct conditions
+_DESCRIPTION_CACHE = OrderedDict()
+_DESCRIPTION_CACHE_SIZE = 128
+
+# The global weather script, shared by all rooms once found
+_WEATHER_SCRIPT = None
+
+def _get_weather_script():
+    """
+    Get the global weather script. It refreshes itself in the background,
+    so rooms only need to find it once rather than querying on every look.
+    
+    Returns:
+        IslandWeatherScript or None: The script, if it exists
+    """
+    global _WEATHER_SCRIPT
+    script = _WEATHER_SCRIPT
+    if script is None or not script.pk:  # Not found yet, or since deleted
+        script = ScriptDB.objects.filter(db_key='weather_controller').first()
+        _WEATHER_SCRIPT = script
+    return script
+
+# (valid until, weather type, apparent temperature) as last read from the
+# weather script. The script refreshes every 15 minutes, so every look in
+# the next few seconds can share one read.
+_WEATHER_READINGS = (0, 'clear', 70)
+_WEATHER_READINGS_TTL = 30
+
+def _get_weather_readings():
+    """
+    Get the current weather type and apparent temperature, reading the
+    weather script at most once per _WEATHER_READINGS_TTL seconds.
+    
+    Returns:
+        tuple: (weather type, apparent temperature); fair weather if there
+            is no weather system yet
+    """
+    global _WEATHER_READINGS
+    now = time()
+    valid_until, weather, temperature = _WEATHER_READINGS
+    if now >= valid_until:
+        weather_script = _get_weather_script()
+        if weather_script:
+            weather = weather_script.db.current_weather
+            temperature = weather_script.db.temperature
+        else:
+            weather, temperature = 'clear', 70
+        _WEATHER_READINGS = (now + _WEATHER_READINGS_TTL, weather, temperature)
+    return weather, temperature
 
 class WeatherAwareRoom(DefaultRoom):
     """Base class for rooms that are affected by weather."""
     
+    # Starting weather modifiers; subclasses override this rather than
+    # rewriting the attribute after creation
+    weather_modifiers = {
+        "sheltered": False,
+        "indoor": False,
+        "magical": False
+    }
+    
     def at_object_creation(self):
         """Called when room is first created."""
         super().at_object_creation()
         self.db.weather_enabled = True
-        self.db.weather_modifiers = {
-            "sheltered": False,
-            "indoor": False,
-            "magical": False
-        }
+        self.db.weather_modifiers = dict(self.weather_modifiers)
+        
+    def get_display_name(self, looker=None, **kwargs):
+        """
+        Get the room's name, with its id for builders. Same as the default,
+        but the permission check is briefly cached on the looker.
+        """
+        if looker and is_builder(looker):
+            return f"{self.name}(#{self.id})"
+        return self.name
         
     def get_current_hour(self):
         """Get the current hour (0-23) in Austin timezone."""
-        austin_tz = pytz.timezone('America/Chicago')
-        austin_time = datetime.now(austin_tz)
-        return austin_time.hour
+        return _current_hour()
         
     def get_current_weather(self):
         """Get current weather condition."""
-        # Get the global weather script using ScriptDB
-        weather_script = ScriptDB.objects.filter(db_key='weather_controller').first()
-        if weather_script:
-            return weather_script.db.current_weather
-        return 'clear'  # Default to clear if no weather system
+        return _get_weather_readings()[0]
         
     def get_weather_data(self):
-        """Get complete weather data."""
-        # Get the global weather script using ScriptDB
-        weather_script = ScriptDB.objects.filter(db_key='weather_controller').first()
-        if weather_script:
-            return {
-                'weathercode': weather_script.db.current_weather,
-                'time_period': self.get_time_period(),
-                'apparent_temperature': weather_script.db.temperature
-            }
-        return None
+        """
+        Get complete weather data. With no weather system yet this
+        describes fair weather rather than leaving the room without its
+        dynamic description.
+        """
+        weather, temperature = _get_weather_readings()
+        return {
+            'weathercode': weather,
+            'time_period': self.get_time_period(),
+            'apparent_temperature': temperature
+        }
+        
+    def get_cached_description(self, build, *inputs, key=None):
+        """
+        Get a description built from the given conditions. Descriptions are
+        shared between rooms of the same class and kept for every set of
+        conditions seen recently, so returning to earlier weather is free.
+        
+        Args:
+            build (callable): Builds the description from `inputs`
+            *inputs: Conditions the description depends on
+            key (tuple, optional): Hashable stand-in for `inputs`, such as
+                readings bucketed into the bands the builder tells apart.
+                Inputs with the same key must build the same description.
+            
+        Returns:
+            str: The description
+        """
+        key = (type(self), build.__name__, inputs if key is None else key)
+        desc = _DESCRIPTION_CACHE.get(key)
+        if desc is not None:
+            _DESCRIPTION_CACHE.move_to_end(key)
+            return desc
+        desc = build(*inputs)
+        _DESCRIPTION_CACHE[key] = desc
+        if len(_DESCRIPTION_CACHE) > _DESCRIPTION_CACHE_SIZE:
+            _DESCRIPTION_CACHE.popitem(last=False)
+        return desc
         
     def get_time_period(self):
         """Get the current time period of day."""
-        hour = self.get_current_hour()
-        
-        if 5 <= hour < 7:
-            return "dawn"
-        elif 7 <= hour < 10:
-            return "morning"
-        elif 10 <= hour < 14:
-            return "noon"
-        elif 14 <= hour < 17:
-            return "afternoon"
-        elif 17 <= hour < 19:
-            return "early_evening"
-        elif 19 <= hour < 22:
-            return "evening"
-        elif 22 <= hour < 24:
-            return "late_night"
-        else:  # 0-5
-            return "witching_hour"
+        return current_time_period()
             
     def wrap_text(self, text):
         """
@@ -80,34 +194,64 @@ class WeatherAwareRoom(DefaultRoom):
             str: Wrapped text
         """
         width = getattr(settings, 'ROOM_DESCRIPTION_WIDTH', 78)
-        wrapper = TextWrapper(width=width, expand_tabs=True, 
-                            replace_whitespace=False,
-                            break_long_words=False,
-                            break_on_hyphens=False)
-        return wrapper.fill(text)
+        return get_wrapper(width, break_words=False).fill(text)
+        
+    def format_desc(self, desc):
+        """
+        Wrap the description for display. The description only changes with
+        the time and weather, so the last result is kept on the room and
+        reused while the text is the same.
+        
+        Args:
+            desc (str): Description from get_display_desc
+            
+        Returns:
+            str: Wrapped description
+        """
+        cached = self.ndb._desc_lines
+        if cached and cached[0] == desc:
+            return cached[1]
+        lines = self.wrap_text(desc)
+        self.ndb._desc_lines = (desc, lines)
+        return lines
+        
+    def format_exits(self, exits):
+        """
+        Format the exits line for display. The exits rarely change, so the
+        last result is kept on the room and reused while they are the same.
+        
+        Args:
+            exits (str): Exits text from get_display_exits
+            
+        Returns:
+            str: Wrapped exits line
+        """
+        cached = self.ndb._exits_line
+        if cached and cached[0] == exits:
+            return cached[1]
+        # Remove any existing "Exits:" prefix that might be in the string
+        line = self.wrap_text(f"Exits: {exits.replace('Exits:', '').strip()}")
+        self.ndb._exits_line = (exits, line)
+        return line
         
     def return_appearance(self, looker, **kwargs):
         """
         This is called when someone looks at this room.
         Only show other characters in the 'You see:' section.
         """
-        # Get room title with proper spacing (two lines before, one after)
-        title = f"|/|/|c{self.get_display_name(looker)}|n|/|/"
+        # Sections are collected in a list and joined once at the end.
+        # Room title with proper spacing (two lines before, one after)
+        parts = [f"|/|/|c{self.get_display_name(looker)}|n|/|/"]
         
         # Get the room description and wrap it
-        description = self.wrap_text(self.get_display_desc(looker, **kwargs))
-        
-        # Combine title and description
-        full_text = f"{title}{description}"
+        parts.append(self.format_desc(self.get_display_desc(looker, **kwargs)))
         
         # Get exits without the "Exits:" prefix
         exits = self.get_display_exits(looker, **kwargs)
         if exits:
-            # Remove any existing "Exits:" prefix that might be in the string
-            exits = exits.replace("Exits:", "").strip()
-            # Wrap the exits text and add spacing (one line before)
-            exits = self.wrap_text(f"Exits: {exits}")
-            full_text += f"|/|/{exits}"
+            # Add spacing (one line before) and the wrapped exits line
+            parts.append("|/|/")
+            parts.append(self.format_exits(exits))
         
         # Get only characters (excluding the looker)
         characters = [obj for obj in self.contents 
@@ -117,15 +261,13 @@ class WeatherAwareRoom(DefaultRoom):
         
         # Only add the "You see:" section if there are other characters present
         if characters:
-            full_text += f"|/|/|wYou see:|n"
-            char_list = []
-            for char in characters:
-                char_list.append(f"  |c{char.get_display_name(looker)}|n")
+            parts.append("|/|/|wYou see:|n|/")
             # Wrap the character list
-            char_text = self.wrap_text(", ".join(char_list))
-            full_text += f"|/{char_text}"
+            parts.append(self.wrap_text(", ".join(
+                f"  |c{char.get_display_name(looker)}|n" for char in characters
+            )))
         
-        return full_text
+        return "".join(parts)
 
 RESPAWN_MESSAGE = """
 The crushing darkness of death gives way to a gentle, phosphorescent glow. Your consciousness drifts through familiar waters - the same waters that lap at the shores of Anchors Edge. Ancient mariners spoke of the Tide Mother's mercy, how she claims no soul that still has purpose in her realm.
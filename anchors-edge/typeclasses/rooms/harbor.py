@@ -3,21 +3,11 @@ Harbor-specific room types and templates.
 """
 
 from typeclasses.rooms.base import WeatherAwareRoom
-from typeclasses.rooms.weather_codes import WEATHER_CODES
+from typeclasses.rooms.weather_codes import THUNDER_CODES, RAIN_CODES, CLOUDY_CODES, NIGHT_PERIODS
 
 class HarborRoom(WeatherAwareRoom):
     """Base class for harbor locations."""
     
-    def at_object_creation(self):
-        """Called when room is first created."""
-        super().at_object_creation()
-        self.db.weather_enabled = True
-        self.db.weather_modifiers = {
-            "sheltered": False,
-            "indoor": False,
-            "magical": False
-        }
-
     def _get_harbor_description(self, looker):
         """Get time-appropriate harbor description."""
         weather_data = self.get_weather_data()
@@ -29,6 +19,20 @@ class HarborRoom(WeatherAwareRoom):
         temp = weather_data.get('apparent_temperature', 70)
         wind_speed = weather_data.get('wind_speed_10m', 0)
         
+        # Readings within the same band give the same description
+        key = (
+            time_period,
+            weather_code,
+            2 if temp > 85 else 0 if temp < 45 else 1,
+            2 if wind_speed > 20 else 1 if wind_speed > 10 else 0
+        )
+        return self.get_cached_description(
+            self._build_harbor_description, time_period, weather_code, temp, wind_speed,
+            key=key
+        )
+        
+    def _build_harbor_description(self, time_period, weather_code, temp, wind_speed):
+        """Build the harbor description for the given conditions."""
         # Get base time-of-day description
         if time_period == "dawn":
             base_desc = (
@@ -81,52 +85,55 @@ class HarborRoom(WeatherAwareRoom):
                 "their preparations, their crews moving like shadows in the darkness."
             )
             
+        # Sentences are collected and joined once at the end
+        parts = [base_desc]
+        
         # Add temperature effects
-        if time_period not in ["late_night", "witching_hour"]:
+        if time_period not in NIGHT_PERIODS:
             if temp > 85:
-                base_desc += " " + (
+                parts.append(
                     "The hot, humid air hangs heavy over the docks, causing workers to move more slowly "
                     "and seek whatever shade they can find between tasks."
                 )
             elif temp < 45:
-                base_desc += " " + (
+                parts.append(
                     "The cold air has workers stamping their feet and rubbing their hands between tasks, "
                     "their breath visible in the chill as they go about their duties."
                 )
         
         # Add wind effects
         if wind_speed > 20:
-            base_desc += " " + (
+            parts.append(
                 "Strong winds whip across the harbor, causing moored vessels to strain at their lines "
                 "while loose canvas snaps sharply in the gusts."
             )
         elif wind_speed > 10:
-            base_desc += " " + (
+            parts.append(
                 "A steady breeze fills the harbor, carrying the mingled scents of salt water and tar "
                 "while setting the moored vessels gently rocking at their berths."
             )
             
         # Add weather effects
-        if weather_code in WEATHER_CODES["thunderstorm"]:
-            base_desc += " " + (
+        if weather_code in THUNDER_CODES:
+            parts.append(
                 "Lightning illuminates the harbor in stark flashes, followed by rolling thunder that "
                 "echoes across the water. Ships' crews scramble to secure any loose gear as the storm rages."
             )
-        elif weather_code in WEATHER_CODES["rain"]:
-            base_desc += " " + (
+        elif weather_code in RAIN_CODES:
+            parts.append(
                 "Rain falls steadily across the harbor, drumming on deck planking and causing the "
                 "water's surface to dance with countless tiny impacts."
             )
-        elif weather_code in WEATHER_CODES["cloudy"]:
-            base_desc += " " + (
+        elif weather_code in CLOUDY_CODES:
+            parts.append(
                 "Clouds hang low over the harbor, their gray masses promising weather to come while "
                 "diffusing the light across the water."
             )
                 
         # Always end with the connections
-        base_desc += " The Market Square lies to the north, while various ships and boats line the docks."
+        parts.append("The Market Square lies to the north, while various ships and boats line the docks.")
         
-        return base_desc
+        return " ".join(parts)
         
     def get_display_desc(self, looker, **kwargs):
         """Get the description of the room."""
@@ -2,22 +2,39 @@
 Island-specific room types and templates.
 """
 
+from bisect import bisect_left
 from typeclasses.rooms.base import WeatherAwareRoom
-from typeclasses.rooms.weather_codes import WEATHER_CODES
+from typeclasses.rooms.weather_codes import THUNDER_CODES, RAIN_CODES, NIGHT_PERIODS
+
+# Hottest part of the day, when the market seeks shade
+_MIDDAY_PERIODS = frozenset(("noon", "afternoon"))
+
+# Readings above which the market description changes
+_TEMP_THRESHOLDS = (45, 60, 75, 85)
+_WIND_THRESHOLDS = (5, 10, 20)
+
+# Market temperature text for each band of _TEMP_THRESHOLDS, coldest first
+_TEMP_TEXTS = (
+    "The cold air has people bundled up as they move quickly about their "
+    "business, while vendors stamp their feet to stay warm.",
+    "The noticeable chill has people hurrying between stalls, some stopping "
+    "to warm their hands on cups of hot tea.",
+    "The mild temperature makes for comfortable trading conditions as people "
+    "browse the stalls.",
+    "The pleasant warmth has brought out plenty of shoppers, adding to the "
+    "square's lively atmosphere.",
+    "The air is thick with humidity, though people still move about their "
+    "business in the heat.",
+)
+# Hottest band during the midday periods
+_MIDDAY_HEAT_TEXT = (
+    "The hot, humid air has driven many to seek shelter in the shade of the "
+    "awnings, while vendors offer cool drinks to thirsty customers."
+)
 
 class IslandRoom(WeatherAwareRoom):
     """Base class for outdoor island locations."""
     
-    def at_object_creation(self):
-        """Called when room is first created."""
-        super().at_object_creation()
-        self.db.weather_enabled = True
-        self.db.weather_modifiers = {
-            "sheltered": False,
-            "indoor": False,
-            "magical": False
-        }
-        
     def get_display_desc(self, looker, **kwargs):
         """Get the description of the room."""
         if self.key == "Market Square":
@@ -35,6 +52,20 @@ class IslandRoom(WeatherAwareRoom):
         temp = weather_data.get('apparent_temperature', 70)
         wind_speed = weather_data.get('wind_speed_10m', 0)
         
+        # Readings within the same band give the same description
+        key = (
+            time_period,
+            weather_code,
+            bisect_left(_TEMP_THRESHOLDS, temp),
+            bisect_left(_WIND_THRESHOLDS, wind_speed)
+        )
+        return self.get_cached_description(
+            self._build_market_description, time_period, weather_code, temp, wind_speed,
+            key=key
+        )
+        
+    def _build_market_description(self, time_period, weather_code, temp, wind_speed):
+        """Build the market description for the given conditions."""
         # Get base time-of-day description
         if time_period == "dawn":
             base_desc = (
@@ -86,93 +117,70 @@ class IslandRoom(WeatherAwareRoom):
                 "begin as early vendors prepare for another day of trade."
             )
             
+        # Sentences are collected and joined once at the end
+        parts = [base_desc]
+        
         # Add temperature effects
-        if time_period not in ["late_night", "witching_hour"]:  # Only add for active market times
-            if temp > 85:
-                if time_period in ["noon", "afternoon"]:
-                    base_desc += " " + (
-                        "The hot, humid air has driven many to seek shelter in the shade of the "
-                        "awnings, while vendors offer cool drinks to thirsty customers."
-                    )
-                else:
-                    base_desc += " " + (
-                        "The air is thick with humidity, though people still move about their "
-                        "business in the heat."
-                    )
-            elif temp > 75:
-                base_desc += " " + (
-                    "The pleasant warmth has brought out plenty of shoppers, adding to the "
-                    "square's lively atmosphere."
-                )
-            elif temp > 60:
-                base_desc += " " + (
-                    "The mild temperature makes for comfortable trading conditions as people "
-                    "browse the stalls."
-                )
-            elif temp > 45:
-                base_desc += " " + (
-                    "The noticeable chill has people hurrying between stalls, some stopping "
-                    "to warm their hands on cups of hot tea."
-                )
+        if time_period not in NIGHT_PERIODS:  # Only add for active market times
+            band = bisect_left(_TEMP_THRESHOLDS, temp)
+            if band == len(_TEMP_THRESHOLDS) and time_period in _MIDDAY_PERIODS:
+                parts.append(_MIDDAY_HEAT_TEXT)
             else:
-                base_desc += " " + (
-                    "The cold air has people bundled up as they move quickly about their "
-                    "business, while vendors stamp their feet to stay warm."
-                )
+                parts.append(_TEMP_TEXTS[band])
         
         # Add wind effects
         if wind_speed > 20:
-            if time_period in ["late_night", "witching_hour"]:
-                base_desc += " " + (
+            if time_period in NIGHT_PERIODS:
+                parts.append(
                     "Strong winds whip through the empty square, stirring up loose papers "
                     "and rattling the occasional shutter."
                 )
             else:
-                base_desc += " " + (
+                parts.append(
                     "Strong winds challenge the vendors' control of their awnings and goods, "
                     "forcing many to secure their wares more carefully."
                 )
         elif wind_speed > 10:
-            if time_period in ["late_night", "witching_hour"]:
-                base_desc += " " + (
+            if time_period in NIGHT_PERIODS:
+                parts.append(
                     "A steady breeze sweeps through the empty square, carrying the day's "
                     "remnants along the cobblestones."
                 )
             else:
-                base_desc += " " + (
+                parts.append(
                     "A steady breeze ripples the awnings and carries the mingled scents "
                     "of the market across the square."
                 )
         elif wind_speed > 5:
-            base_desc += " " + (
+            parts.append(
                 "A gentle breeze carries the various scents of the market through the air."
             )
             
         # Add weather effects
-        if weather_code in WEATHER_CODES["thunderstorm"]:
-            if time_period in ["late_night", "witching_hour"]:
-                base_desc += " " + (
+        if weather_code in THUNDER_CODES:
+            if time_period in NIGHT_PERIODS:
+                parts.append(
                     "Lightning illuminates the empty square in brief, dramatic flashes, while "
                     "thunder echoes between the surrounding buildings."
                 )
             else:
-                base_desc += " " + (
+                parts.append(
                     "Lightning flashes overhead as vendors scramble to secure their goods, "
                     "some already packing up early to avoid the worst of the storm."
                 )
-        elif weather_code in WEATHER_CODES["rain"]:
-            if time_period in ["late_night", "witching_hour"]:
-                base_desc += " " + (
+        elif weather_code in RAIN_CODES:
+            if time_period in NIGHT_PERIODS:
+                parts.append(
                     "Rain falls steadily on the empty cobblestones, creating a peaceful rhythm "
                     "in the quiet square."
                 )
             else:
-                base_desc += " " + (
+                parts.append(
                     "Vendors huddle under their awnings as rain falls steadily, while determined "
                     "shoppers hurry between the sheltered stalls."
                 )
                 
         # Always end with the connection to the harbor
-        base_desc += " The Harbor District lies to the south."
+        parts.append("The Harbor District lies to the south.")
         
-        return base_desc
+        return " ".join(parts)
@@ -2,20 +2,30 @@
 Weather code definitions and mappings.
 """
 
+# Weather type -> frozenset of Open-Meteo codes, for constant-time
+# membership tests
 WEATHER_CODES = {
-    "clear": [0],  # Clear sky
-    "partly_cloudy": [1, 2, 3],  # Partly cloudy
-    "cloudy": [45, 48],  # Foggy/cloudy
-    "rain": [51, 53, 55, 61, 63, 65, 80, 81, 82],  # Various intensities of rain
-    "snow": [71, 73, 75, 77, 85, 86],  # Various intensities of snow
-    "thunderstorm": [95, 96, 99],  # Thunderstorm
-    "drizzle": [51, 53, 55],  # Drizzle
-    "heavy_rain": [65, 82],  # Heavy rain
-    "light_rain": [61, 80],  # Light rain
-    "moderate_rain": [63, 81],  # Moderate rain
-    "freezing_rain": [66, 67],  # Freezing rain
-    "sleet": [68, 69, 83, 84],  # Sleet
-    "light_snow": [71, 85],  # Light snow
-    "moderate_snow": [73, 86],  # Moderate snow
-    "heavy_snow": [75, 77],  # Heavy snow
-} 
\ No newline at end of file
+    "clear": frozenset({0}),  # Clear sky
+    "partly_cloudy": frozenset({1, 2, 3}),  # Partly cloudy
+    "cloudy": frozenset({45, 48}),  # Foggy/cloudy
+    "rain": frozenset({51, 53, 55, 61, 63, 65, 80, 81, 82}),  # Various intensities of rain
+    "snow": frozenset({71, 73, 75, 77, 85, 86}),  # Various intensities of snow
+    "thunderstorm": frozenset({95, 96, 99}),  # Thunderstorm
+    "drizzle": frozenset({51, 53, 55}),  # Drizzle
+    "heavy_rain": frozenset({65, 82}),  # Heavy rain
+    "light_rain": frozenset({61, 80}),  # Light rain
+    "moderate_rain": frozenset({63, 81}),  # Moderate rain
+    "freezing_rain": frozenset({66, 67}),  # Freezing rain
+    "sleet": frozenset({68, 69, 83, 84}),  # Sleet
+    "light_snow": frozenset({71, 85}),  # Light snow
+    "moderate_snow": frozenset({73, 86}),  # Moderate snow
+    "heavy_snow": frozenset({75, 77}),  # Heavy snow
+}
+
+# The sets checked on every description build
+THUNDER_CODES = WEATHER_CODES["thunderstorm"]
+RAIN_CODES = WEATHER_CODES["rain"]
+CLOUDY_CODES = WEATHER_CODES["cloudy"]
+
+# Time periods when the streets and market are empty
+NIGHT_PERIODS = frozenset(("late_night", "witching_hour"))
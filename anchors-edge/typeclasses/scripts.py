@@ -3,12 +3,74 @@ Scripts for weather and time systems.
 """
 from evennia import DefaultScript
 from evennia.utils import logger
-from datetime import datetime
-import pytz
-import requests
+from twisted.internet.threads import deferToThread
+from utils.http import SESSION, WEATHER_TIMEOUT, parse_json
+from typeclasses.rooms.base import current_time_period
 import time
 from typing import Dict, Optional
 
+WEATHER_URL = (
+    "https://api.open-meteo.com/v1/forecast?"
+    "latitude={lat}&longitude={lon}"
+    "&current=apparent_temperature,precipitation,rain,showers,"
+    "weathercode,cloud_cover,wind_speed_10m,wind_direction_10m,"
+    "wind_gusts_10m&temperature_unit=fahrenheit&wind_speed_unit=mph"
+    "&precipitation_unit=inch&timezone=America%2FChicago"
+)
+
+# Open-Meteo weather code -> simple weather type; unlisted codes count as clear
+_WEATHER_TYPES = dict.fromkeys((2, 3), 'cloudy')
+_WEATHER_TYPES.update(dict.fromkeys((51, 53, 55, 61, 63, 65, 80, 81, 82), 'rain'))
+_WEATHER_TYPES.update(dict.fromkeys((95, 96, 99), 'storm'))
+
+# Marks a fetch the API answered with 304 Not Modified
+NOT_MODIFIED = "not_modified"
+
+def fetch_weather(coordinates, validators=None):
+    """
+    Fetch current weather for each island. This runs in a worker thread,
+    so it must not touch the database.
+    
+    Requests are conditional on the validators (ETag, Last-Modified) from
+    the previous response, so unchanged data isn't downloaded and parsed
+    again.
+    
+    Args:
+        coordinates (dict): Island name mapped to its (lat, lon)
+        validators (dict, optional): Island name mapped to the
+            (etag, last_modified) of its last successful response
+        
+    Returns:
+        dict: Island name mapped to a (weather_data, error, validators)
+            tuple. weather_data is None if the fetch failed, or
+            NOT_MODIFIED if the stored data is still current.
+    """
+    validators = validators or {}
+    results = {}
+    for island, (lat, lon) in coordinates.items():
+        etag, last_modified = validators.get(island) or (None, None)
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            response = SESSION.get(WEATHER_URL.format(lat=lat, lon=lon), headers=headers,
+                                   timeout=WEATHER_TIMEOUT)
+            if response.status_code == 304:
+                results[island] = (NOT_MODIFIED, None, (etag, last_modified))
+            elif response.status_code == 200:
+                results[island] = (
+                    parse_json(response)['current'],
+                    None,
+                    (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                )
+            else:
+                results[island] = (None, response.status_code, None)
+        except Exception as e:
+            results[island] = (None, e, None)
+    return results
+
 class IslandWeatherScript(DefaultScript):
     """
     A global script that manages weather and time systems.
@@ -36,18 +98,6 @@ class IslandWeatherScript(DefaultScript):
             "main_island": (21.4655745, -71.1390341),  # Turks and Caicos
         }
         
-        # Time period definitions
-        self.db.time_periods = {
-            "dawn": (5, 7),          # 5:00 AM - 7:00 AM
-            "morning": (7, 11),      # 7:00 AM - 11:00 AM
-            "noon": (11, 14),        # 11:00 AM - 2:00 PM
-            "afternoon": (14, 17),    # 2:00 PM - 5:00 PM
-            "early_evening": (17, 19),# 5:00 PM - 7:00 PM
-            "evening": (19, 23),      # 7:00 PM - 11:00 PM
-            "late_night": (23, 2),    # 11:00 PM - 2:00 AM
-            "witching_hour": (2, 5)   # 2:00 AM - 5:00 AM
-        }
-        
         # Current time period
         self.db.current_time_period = self.get_current_time_period()
         
@@ -55,30 +105,8 @@ class IslandWeatherScript(DefaultScript):
         self.update_weather()
         
     def get_current_time_period(self) -> str:
-        """Get the current time period based on Austin time."""
-        austin_tz = pytz.timezone('America/Chicago')
-        current_time = datetime.now(austin_tz)
-        current_hour = current_time.hour
-        
-        # Handle periods that cross midnight
-        if current_hour >= 23 or current_hour < 2:
-            return "late_night"
-        elif 2 <= current_hour < 5:
-            return "witching_hour"
-        elif 5 <= current_hour < 7:
-            return "dawn"
-        elif 7 <= current_hour < 11:
-            return "morning"
-        elif 11 <= current_hour < 14:
-            return "noon"
-        elif 14 <= current_hour < 17:
-            return "afternoon"
-        elif 17 <= current_hour < 19:
-            return "early_evening"
-        elif 19 <= current_hour < 23:
-            return "evening"
-        
-        return "day"  # Default fallback
+        """Get the current time period, as rooms see it."""
+        return current_time_period()
         
     def at_repeat(self):
         """Called every self.interval seconds."""
@@ -92,59 +120,84 @@ class IslandWeatherScript(DefaultScript):
         self.update_weather()
         
     def update_weather(self):
-        """Update weather for all islands."""
-        try:
-            # Default values in case API fails
-            default_weather = {
-                'apparent_temperature': self.db.temperature,
-                'weathercode': 0,  # Clear sky
-                'wind_speed_10m': self.db.wind_speed,
-                'time_period': self.db.current_time_period
-            }
+        """
+        Update weather for all islands.
+        
+        The API calls run in a worker thread so the reactor is never blocked
+        waiting on the network; results are stored once they arrive.
+        """
+        if self.ndb.weather_updating:
+            return  # A refresh is already in flight
+        self.ndb.weather_updating = True
+        
+        # Copy out of the attribute store before handing to the thread
+        coordinates = dict(self.db.coordinates)
+        validators = dict(self.db.weather_validators or {})
+        deferred = deferToThread(fetch_weather, coordinates, validators)
+        deferred.addCallback(self._store_weather)
+        deferred.addErrback(self._weather_update_failed)
+        deferred.addBoth(self._end_weather_update)
+        
+    def _store_weather(self, results):
+        """Store fetched weather data. Called on the main thread."""
+        # Saved containers persist item assignment, so bind them once
+        time_period = self.db.current_time_period
+        weather_systems = self.db.weather_systems
+        last_updates = self.db.last_updates
+        
+        # Default values in case API fails
+        default_weather = {
+            'apparent_temperature': self.db.temperature,
+            'weathercode': 0,  # Clear sky
+            'wind_speed_10m': self.db.wind_speed,
+            'time_period': time_period
+        }
+        
+        validators = self.db.weather_validators or {}
+        for island, (weather_data, error, island_validators) in results.items():
+            if weather_data is None:
+                weather_systems[island] = default_weather
+                validators.pop(island, None)
+                logger.log_err(f"Failed to get weather data for {island}: {error}")
+                continue
             
-            for island, coords in self.db.coordinates.items():
-                try:
-                    lat, lon = coords
-                    url = (f"https://api.open-meteo.com/v1/forecast?"
-                          f"latitude={lat}&longitude={lon}"
-                          f"&current=apparent_temperature,precipitation,rain,showers,"
-                          f"weathercode,cloud_cover,wind_speed_10m,wind_direction_10m,"
-                          f"wind_gusts_10m&temperature_unit=fahrenheit&wind_speed_unit=mph"
-                          f"&precipitation_unit=inch&timezone=America%2FChicago")
-                    
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        weather_data = response.json()['current']
-                        # Store main values separately for easy access
-                        self.db.temperature = weather_data.get('apparent_temperature', 70)
-                        self.db.wind_speed = weather_data.get('wind_speed_10m', 5)
-                        self.db.current_weather = self._get_weather_type(weather_data.get('weathercode', 0))
-                        
-                        # Add time period to weather data
-                        weather_data['time_period'] = self.db.current_time_period
-                        self.db.weather_systems[island] = weather_data
-                        self.db.last_updates[island] = time.time()
-                        logger.log_info(f"Updated weather for {island}: {weather_data}")
-                    else:
-                        self.db.weather_systems[island] = default_weather
-                        logger.log_err(f"Failed to get weather data for {island}: {response.status_code}")
-                except Exception as e:
-                    self.db.weather_systems[island] = default_weather
-                    logger.log_err(f"Error updating weather for {island}: {e}")
-        except Exception as e:
-            logger.log_err(f"Critical error in weather update: {e}")
+            if weather_data == NOT_MODIFIED:
+                # Stored data is still current; only refresh its time period
+                stored = weather_systems.get(island)
+                if stored:
+                    stored['time_period'] = time_period
+                    weather_systems[island] = stored
+                    last_updates[island] = time.time()
+                    continue
+                # Nothing stored to reuse; fetch in full next time
+                validators.pop(island, None)
+                continue
+            
+            validators[island] = island_validators
+                
+            # Store main values separately for easy access
+            self.db.temperature = weather_data.get('apparent_temperature', 70)
+            self.db.wind_speed = weather_data.get('wind_speed_10m', 5)
+            self.db.current_weather = self._get_weather_type(weather_data.get('weathercode', 0))
+            
+            # Add time period to weather data
+            weather_data['time_period'] = time_period
+            weather_systems[island] = weather_data
+            last_updates[island] = time.time()
+            logger.log_info(f"Updated weather for {island}: {weather_data}")
+        self.db.weather_validators = validators
+            
+    def _weather_update_failed(self, failure):
+        """Log an unexpected error from a weather refresh."""
+        logger.log_err(f"Critical error in weather update: {failure.getErrorMessage()}")
+        
+    def _end_weather_update(self, result):
+        """Allow the next weather refresh to start."""
+        self.ndb.weather_updating = False
     
     def _get_weather_type(self, code: int) -> str:
         """Convert weather code to simple weather type."""
-        if code in [0, 1]:
-            return 'clear'
-        elif code in [2, 3]:
-            return 'cloudy'
-        elif code in [51, 53, 55, 61, 63, 65, 80, 81, 82]:
-            return 'rain'
-        elif code in [95, 96, 99]:
-            return 'storm'
-        return 'clear'
+        return _WEATHER_TYPES.get(code, 'clear')
     
     def get_weather_data(self, island: str = "main_island") -> Optional[Dict]:
         """Get current weather data for an island."""
@@ -24,15 +24,14 @@ class WorldCleanupScript(DefaultScript):
         char_map = {}
         
         for account in accounts:
-            if hasattr(account.db, '_playable_characters'):
-                for char in account.db._playable_characters:
-                    if char:
-                        char_map[account.id] = {
-                            'key': char.key,
-                            'desc': char.db.desc if hasattr(char.db, 'desc') else '',
-                            'permissions': char.permissions.all(),
-                            'cmdsets': [cmdset.path for cmdset in char.cmdset.all()]
-                        }
+            for char in account.db._playable_characters or ():
+                if char:
+                    char_map[account.id] = {
+                        'key': char.key,
+                        'desc': char.db.desc or '',
+                        'permissions': char.permissions.all(),
+                        'cmdsets': [cmdset.path for cmdset in char.cmdset.all()]
+                    }
         
         # Delete all objects except system rooms (limbo etc)
         for obj in ObjectDB.objects.all():
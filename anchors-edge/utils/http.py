@@ -0,0 +1,27 @@
+"""
+Shared HTTP session for outbound API calls.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson parses API responses several times faster than the stdlib, but
+# is optional
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# One pooled session for the weather and OpenRouter APIs, so keep-alive
+# connections (and their TLS handshakes) are reused between calls.
+# Retries only cover connection failures, so POSTs are never resent.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2))
+
+# (connect, read) timeouts in seconds
+WEATHER_TIMEOUT = (3, 10)
+LLM_TIMEOUT = (3, 30)
+
+def parse_json(response):
+    """Parse a response body as JSON with the fastest available parser."""
+    return json_loads(response.content)
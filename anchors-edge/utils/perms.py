@@ -0,0 +1,31 @@
+"""
+Permission check utilities.
+"""
+
+from time import time
+
+_BUILDER_LOCKSTRING = "perm(Admin) or perm(Builder)"
+
+# Seconds a builder check is reused for. Long enough to cover the room,
+# furniture and window names shown by one look, short enough that quelling
+# or a permission change shows up right away.
+_BUILDER_CACHE_SECONDS = 2
+
+def is_builder(looker):
+    """
+    Check whether the looker is an Admin or Builder. The lockstring is
+    parsed on every check and a single look asks once per object shown,
+    so the result is briefly kept on the looker (non-persistent).
+
+    Args:
+        looker (Object): The object doing the looking
+
+    Returns:
+        bool: True if the looker has Admin or Builder permission
+    """
+    now = time()
+    cached = looker.ndb._is_builder
+    if cached is None or now - cached[0] > _BUILDER_CACHE_SECONDS:
+        cached = looker.ndb._is_builder = (
+            now, bool(looker.locks.check_lockstring(looker, _BUILDER_LOCKSTRING)))
+    return cached[1]
@@ -2,6 +2,28 @@
 Text formatting utilities.
 """
 
+from functools import lru_cache
+from textwrap import TextWrapper
+
+@lru_cache(maxsize=8)
+def get_wrapper(width=78, break_words=True):
+    """
+    Get a shared TextWrapper for the given settings, so descriptions
+    wrapped on every look don't build a new wrapper each time.
+    
+    Args:
+        width (int): Line width to wrap to
+        break_words (bool): Whether long words and hyphenated words
+            may be split across lines
+        
+    Returns:
+        TextWrapper: A wrapper that expands tabs and keeps whitespace
+    """
+    return TextWrapper(width=width, expand_tabs=True,
+                       replace_whitespace=False,
+                       break_long_words=break_words,
+                       break_on_hyphens=break_words)
+
 def format_description(text):
     """
     Format description text by: